@@ -93,196 +93,265 @@ MIN_HISTORICAL_DIVIDENDS = 2  # Minimum number of historical dividends to make p
 RECENT_ANNOUNCEMENT_WINDOW = 60  # Days to check for recent announcements (exclude companies)
 TOLERANCE_DAYS = 7  # Days tolerance for pattern matching
 
+# Debugging
+DEBUG_COMPANIES = frozenset()  # Company names to trace during analysis, e.g. {'לאומי (LUMI)'}
+
 # Output settings
 DEFAULT_OUTPUT_ENCODING = 'utf-8-sig'  # Encoding for CSV output files
 CONSOLE_ENCODING = 'utf-8'  # Console output encoding
 
 # Date format
 DATE_FORMAT = '%d.%m.%Y'
+USE_COLUMNS = ['חברה', 'יום אקס דיבידנד', 'דיבידנד']  # Only columns the prediction reads
+DATE_COLUMNS = ['יום אקס דיבידנד']  # Columns parsed as dates
+MONTH_DAY_KEYS = 13 * 32  # Packed month/day keys (month * 32 + day)
+
+# Analysis and prediction table layouts
+PATTERN_COLUMNS = ['חברה', 'month', 'day', 'frequency', 'last_year', 'avg_dividend', 'years']
+PREDICTION_COLUMNS = ['חברה', 'predicted_ex_date', 'days_until', 'frequency',
+                      'last_occurrence', 'avg_dividend', 'confidence', 'pattern_years']
 
 # =============================================================================
 
 import pandas as pd
 import argparse
-import glob
 import os
+import functools
 from datetime import datetime, timedelta
-from collections import defaultdict
 import numpy as np
 
+def list_csv_files():
+    """List CSV files in the current directory with a single directory scan."""
+    with os.scandir('.') as entries:
+        return [entry for entry in entries
+                if entry.name.endswith('.csv') and not entry.name.startswith('.') and entry.is_file()]
+
 def find_latest_csv_file():
     """Find the most recent CSV file containing dividend data."""
-    csv_files = glob.glob("*Historical_Dividend*.csv")
-    if not csv_files:
-        csv_files = glob.glob("*.csv")
+    csv_files = list_csv_files()
+    candidates = [entry for entry in csv_files if 'Historical_Dividend' in entry.name] or csv_files
     
-    if not csv_files:
+    if not candidates:
         return None
     
-    return max(csv_files, key=os.path.getmtime)
+    return max(candidates, key=lambda entry: entry.stat().st_mtime).name
+
+def read_dividend_csv(csv_file):
+    """Read the dividend CSV with a fixed schema, parsing dates while reading."""
+    read_options = {
+        'usecols': USE_COLUMNS,
+        'dtype': {'חברה': 'string', 'דיבידנד': 'float64'},
+        'parse_dates': DATE_COLUMNS,
+        'date_format': DATE_FORMAT
+    }
+    try:
+        import pyarrow  # noqa: F401
+        read_options['engine'] = 'pyarrow'
+    except ImportError:
+        pass
+    
+    # Read CSV with proper encoding for Hebrew
+    try:
+        df = pd.read_csv(csv_file, encoding=DEFAULT_OUTPUT_ENCODING, **read_options)
+    except UnicodeDecodeError:
+        df = pd.read_csv(csv_file, encoding='utf-8', **read_options)
+    
+    # The reader leaves a column unparsed if any value is malformed (e.g. '--')
+    for col in DATE_COLUMNS:
+        if not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col].str.strip(), format=DATE_FORMAT, errors='coerce', cache=True)
+    
+    return df
+
+@functools.lru_cache(maxsize=4)
+def load_dividend_data(csv_file, mtime):
+    """Load and normalize dividend data, cached per file path and modification time.
+    
+    The returned DataFrame is shared between calls and must not be modified.
+    """
+    df = read_dividend_csv(csv_file)
+    
+    # Drop rows without an ex-dividend date (including the empty first row)
+    df = df[df['יום אקס דיבידנד'].notna()].reset_index(drop=True)
+    
+    # Normalize company names (replace non-breaking spaces with regular spaces)
+    df['חברה'] = df['חברה'].str.replace('\xa0', ' ', regex=False)
+    # Categorical company names make grouping compare integer codes instead of strings
+    df['חברה'] = df['חברה'].astype('category')
+    
+    # Extract date parts once so the analysis works on small integer columns
+    df['ex_month'] = df['יום אקס דיבידנד'].dt.month.astype('int8')
+    df['ex_day'] = df['יום אקס דיבידנד'].dt.day.astype('int8')
+    df['ex_year'] = df['יום אקס דיבידנד'].dt.year.astype('int16')
+    
+    return df
 
 def analyze_dividend_patterns(df, min_frequency):
-    """Analyze historical dividend patterns to predict upcoming announcements with custom frequency."""
+    """Analyze historical dividend patterns to predict upcoming announcements with custom frequency.
+    
+    Returns a DataFrame with one row per frequent pattern and PATTERN_COLUMNS as columns.
+    """
     print("Analyzing historical dividend patterns...")
     
-    # Group by company
-    company_patterns = {}
+    pattern_rows = []
     today = datetime.now().date()
     recent_cutoff = today - timedelta(days=RECENT_ANNOUNCEMENT_WINDOW)
     
-    for company in df['חברה'].unique():
-        company_data = df[df['חברה'] == company].copy()
-        
-        # Debug: Print all companies processed
-        if company in ['לאומי (LUMI)', 'בינלאומי (FIBI)']:
-            print(f"DEBUG: Processing {company}")
-            print(f"  Company data count: {len(company_data)}")
-            print(f"  Min frequency required: {min_frequency}")
-        
-        # Skip if not enough historical data
-        if len(company_data) < min_frequency:
-            if company in ['לאומי (LUMI)', 'בינלאומי (FIBI)']:
-                print(f"  -> SKIPPING {company} - not enough data ({len(company_data)} < {min_frequency})")
-            continue
-            
-        # Check if company has announced recently (skip if yes)
-        recent_announcements = company_data[
-            company_data['יום אקס דיבידנד'].dt.date >= recent_cutoff        ]
-        
-        # Debug: Print for Leumi specifically
-        if company == 'לאומי (LUMI)':
-            print(f"DEBUG: {company}")
-            print(f"  Recent cutoff: {recent_cutoff}")
-            print(f"  Company data dates: {company_data['יום אקס דיבידנד'].dt.date.tolist()}")
-            print(f"  Recent announcements count: {len(recent_announcements)}")
-            if not recent_announcements.empty:
-                print(f"  Most recent announcement: {recent_announcements['יום אקס דיבידנד'].dt.date.max()}")
-        
-        if not recent_announcements.empty:
-            if company == 'לאומי (LUMI)':
-                print(f"  -> SKIPPING {company} due to recent announcement")
-            continue  # Skip companies with recent announcements
-        
-        # Sort by ex-dividend date
-        company_data = company_data.sort_values('יום אקס דיבידנד')
-        
+    # Group by company once instead of masking the whole frame per company
+    counts = df.groupby('חברה', sort=False, observed=True).size()
+    recent_mask = df['יום אקס דיבידנד'] >= pd.Timestamp(recent_cutoff)
+    has_recent = recent_mask.groupby(df['חברה'], sort=False, observed=True).any()
+    
+    for company in counts.index.intersection(list(DEBUG_COMPANIES)):
+        print_company_trace(df, company, min_frequency, recent_mask, recent_cutoff)
+    
+    # Skip companies without enough historical data or with recent announcements
+    eligible = counts.index[(counts >= min_frequency) & ~has_recent]
+    
+    # Sort by ex-dividend date once; groups keep this order
+    eligible_data = df[df['חברה'].isin(eligible)].sort_values('יום אקס דיבידנד', kind='stable')
+    
+    for company, company_data in eligible_data.groupby('חברה', sort=False, observed=True):
         # Calculate patterns
         patterns = analyze_company_pattern_with_freq(company_data, company, min_frequency)
         if patterns:
-            company_patterns[company] = patterns
+            pattern_rows.extend({'חברה': company, **pattern} for pattern in patterns)
     
-    return company_patterns
+    return pd.DataFrame(pattern_rows, columns=PATTERN_COLUMNS)
 
-def analyze_company_pattern_with_freq(company_data, company_name, min_frequency):
-    """Analyze dividend pattern for a specific company with custom frequency."""
-    # Extract month/day patterns from historical data
-    historical_dates = []
+def print_company_trace(df, company, min_frequency, recent_mask, recent_cutoff):
+    """Print how a company passes through the analysis filters (debug aid)."""
+    company_dates = df.loc[df['חברה'] == company, 'יום אקס דיבידנד']
+    
+    print(f"DEBUG: Processing {company}")
+    print(f"  Company data count: {len(company_dates)}")
+    print(f"  Min frequency required: {min_frequency}")
+    if len(company_dates) < min_frequency:
+        print(f"  -> SKIPPING {company} - not enough data ({len(company_dates)} < {min_frequency})")
+        return
     
-    for _, row in company_data.iterrows():
-        ex_date = row['יום אקס דיבידנד']
-        if pd.notna(ex_date):
-            historical_dates.append(ex_date.date())
+    recent_dates = company_dates[recent_mask.loc[company_dates.index]]
+    print(f"  Recent cutoff: {recent_cutoff}")
+    print(f"  Company data dates: {list(company_dates.dt.strftime('%Y-%m-%d'))}")
+    print(f"  Recent announcements count: {len(recent_dates)}")
+    if not recent_dates.empty:
+        print(f"  Most recent announcement: {recent_dates.max():%Y-%m-%d}")
+        print(f"  -> SKIPPING {company} due to recent announcement")
+
+def analyze_company_pattern_with_freq(company_data, company_name, min_frequency):
+    """Analyze dividend pattern for a specific company with custom frequency.
     
-    if len(historical_dates) < min_frequency:
+    Expects company_data as returned by load_dividend_data, sorted by ex-dividend
+    date so pattern years come out in order.
+    """
+    if len(company_data) < min_frequency:
         return None
     
-    # Sort dates
-    historical_dates.sort()
+    years = company_data['ex_year'].to_numpy()
     
     # Find common patterns (month/day combinations)
-    month_day_patterns = defaultdict(list)
-    
-    for date in historical_dates:
-        month_day = (date.month, date.day)
-        month_day_patterns[month_day].append(date.year)
+    keys, counts, avg_dividends = count_month_day_patterns(
+        company_data['ex_month'].to_numpy(),
+        company_data['ex_day'].to_numpy(),
+        company_data['דיבידנד'].to_numpy(dtype=float)
+    )
     
-    # Find most frequent patterns
+    # Keep patterns that appear at least twice, in order of first occurrence
     frequent_patterns = []
-    for (month, day), years in month_day_patterns.items():
-        if len(years) >= 2:  # Pattern appears at least twice
-            avg_dividend = company_data[
-                (company_data['יום אקס דיבידנד'].dt.month == month) &
-                (company_data['יום אקס דיבידנד'].dt.day == day)
-            ]['דיבידנד'].mean()
-            
-            last_year = max(years)
-            frequency = len(years)
-            
-            frequent_patterns.append({
-                'month': month,
-                'day': day,
-                'frequency': frequency,
-                'last_year': last_year,
-                'avg_dividend': avg_dividend,
-                'years': years
-            })
+    for key in pd.unique(keys[counts[keys] >= 2]):
+        pattern_years = years[keys == key].tolist()
+        frequent_patterns.append({
+            'month': int(key // 32),
+            'day': int(key % 32),
+            'frequency': int(counts[key]),
+            'last_year': max(pattern_years),
+            'avg_dividend': avg_dividends[key],
+            'years': pattern_years
+        })
     
     return frequent_patterns if frequent_patterns else None
 
-def predict_upcoming_announcements(company_patterns, prediction_days=DEFAULT_PREDICTION_DAYS):
-    """Predict upcoming dividend announcements based on historical patterns."""
-    today = datetime.now().date()
+def count_month_day_patterns(months, days, dividends):
+    """Count month/day pairs in arrays of ex-dividend dates.
+    
+    Each pair is packed into one key (month * 32 + day). Returns the key of every
+    date plus occurrence counts and average dividends indexed by key.
+    """
+    keys = months.astype(np.intp) * 32 + days
+    counts = np.bincount(keys, minlength=MONTH_DAY_KEYS)
+    
+    # Average only the dividends that are present, like pandas mean()
+    has_dividend = ~np.isnan(dividends)
+    dividend_sums = np.bincount(keys[has_dividend], weights=dividends[has_dividend], minlength=MONTH_DAY_KEYS)
+    dividend_counts = np.bincount(keys[has_dividend], minlength=MONTH_DAY_KEYS)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_dividends = dividend_sums / dividend_counts
+    
+    return keys, counts, avg_dividends
+
+def predict_upcoming_announcements(patterns, prediction_days=DEFAULT_PREDICTION_DAYS):
+    """Predict upcoming dividend announcements based on historical patterns.
+    
+    Takes the pattern DataFrame from analyze_dividend_patterns and returns a
+    DataFrame with PREDICTION_COLUMNS as columns.
+    """
+    today = pd.Timestamp(datetime.now().date())
     end_date = today + timedelta(days=prediction_days)
     
-    predictions = []
-    
-    for company, patterns in company_patterns.items():
-        for pattern in patterns:
-            # Try current year and next year
-            for year in [today.year, today.year + 1]:
-                try:
-                    predicted_date = datetime(year, pattern['month'], pattern['day']).date()
-                    
-                    # Check if prediction falls within our window
-                    if today <= predicted_date <= end_date:
-                        # Calculate days until prediction
-                        days_until = (predicted_date - today).days
-                        
-                        # Calculate confidence based on frequency and recency
-                        confidence = calculate_confidence(pattern, year)
-                        
-                        predictions.append({
-                            'חברה': company,
-                            'predicted_ex_date': predicted_date,
-                            'days_until': days_until,
-                            'frequency': pattern['frequency'],
-                            'last_occurrence': pattern['last_year'],
-                            'avg_dividend': pattern['avg_dividend'],
-                            'confidence': confidence,
-                            'pattern_years': ', '.join(map(str, pattern['years']))
-                        })
-                        
-                except ValueError:
-                    # Invalid date (e.g., Feb 29 in non-leap year)
-                    continue
+    # Try current year and next year
+    candidates = pd.concat([
+        patterns.assign(year=today.year),
+        patterns.assign(year=today.year + 1)
+    ], ignore_index=True)
+    
+    # Invalid dates (e.g., Feb 29 in non-leap year) become NaT and drop out of the window
+    candidates['predicted_ex_date'] = pd.to_datetime(candidates[['year', 'month', 'day']], errors='coerce')
+    
+    # Check if prediction falls within our window
+    candidates = candidates[candidates['predicted_ex_date'].between(today, end_date)]
+    if candidates.empty:
+        return pd.DataFrame(columns=PREDICTION_COLUMNS)
+    
+    # Calculate days until prediction and confidence based on frequency and recency
+    predictions = pd.DataFrame({
+        'חברה': candidates['חברה'],
+        'predicted_ex_date': candidates['predicted_ex_date'],
+        'days_until': (candidates['predicted_ex_date'] - today).dt.days,
+        'frequency': candidates['frequency'],
+        'last_occurrence': candidates['last_year'],
+        'avg_dividend': candidates['avg_dividend'],
+        'confidence': calculate_confidence(
+            candidates['frequency'].to_numpy(),
+            candidates['last_year'].to_numpy(),
+            candidates['year'].to_numpy()
+        ),
+        'pattern_years': candidates['years'].map(lambda years: ', '.join(map(str, years)))
+    })
     
     # Sort by days until and confidence
-    predictions.sort(key=lambda x: (x['days_until'], -x['confidence']))
-    
-    return predictions
+    return predictions.sort_values(['days_until', 'confidence'], ascending=[True, False], kind='stable')
 
-def calculate_confidence(pattern, predicted_year):
-    """Calculate confidence score for a prediction."""
+def calculate_confidence(frequency, last_year, predicted_year):
+    """Calculate confidence scores for predictions given as arrays."""
     # Base confidence on frequency
-    frequency_score = min(pattern['frequency'] / 5.0, 1.0)  # Max at 5 occurrences
+    frequency_score = np.minimum(frequency / 5.0, 1.0)  # Max at 5 occurrences
     
     # Penalty for time since last occurrence
-    years_since_last = predicted_year - pattern['last_year']
-    recency_score = max(0, 1.0 - (years_since_last - 1) * 0.2)  # Penalty after first year
+    years_since_last = predicted_year - last_year
+    recency_score = np.maximum(0.0, 1.0 - (years_since_last - 1) * 0.2)  # Penalty after first year
     
     # Combined confidence
     confidence = (frequency_score * 0.7 + recency_score * 0.3) * 100
     
-    return round(confidence, 1)
+    return np.round(confidence, 1)
 
 def save_predictions_to_csv(predictions, output_file):
     """Save predictions to CSV with proper UTF-8 encoding."""
-    if not predictions:
+    if predictions.empty:
         print("No predictions to save.")
         return
         
-    df = pd.DataFrame(predictions)
-    df['predicted_ex_date'] = df['predicted_ex_date'].apply(lambda x: x.strftime(DATE_FORMAT))
+    df = predictions.assign(predicted_ex_date=predictions['predicted_ex_date'].dt.strftime(DATE_FORMAT))
     
     df.to_csv(output_file, index=False, encoding=DEFAULT_OUTPUT_ENCODING)
     print(f"Predicted announcements saved to: {output_file}")
@@ -297,23 +366,25 @@ def print_predictions(predictions, prediction_days):
     print(f"Based on historical patterns, excluding companies with recent announcements")
     print("=" * 80)
     
-    if not predictions:
+    if predictions.empty:
         print("No dividend announcements predicted based on historical patterns.")
         return
     
     print(f"\n📈 LIKELY UPCOMING ANNOUNCEMENTS ({len(predictions)} companies):")
     print("=" * 80)
     
-    for i, pred in enumerate(predictions, 1):
-        predicted_date = pred['predicted_ex_date'].strftime(DATE_FORMAT)
+    for i, (company, predicted_ex_date, days_until, frequency, last_occurrence,
+            avg_dividend, confidence, pattern_years) in enumerate(
+            predictions[PREDICTION_COLUMNS].itertuples(index=False, name=None), 1):
+        predicted_date = predicted_ex_date.strftime(DATE_FORMAT)
         
-        print(f"{i}. 🏢 {pred['חברה']}")
-        print(f"   📅 Predicted Ex-Date: {predicted_date} ({pred['days_until']} days)")
-        print(f"   💰 Avg Historical Dividend: {pred['avg_dividend']:.4f}")
-        print(f"   📊 Pattern Frequency: {pred['frequency']} times")
-        print(f"   🎯 Confidence: {pred['confidence']}%")
-        print(f"   📈 Last Occurrence: {pred['last_occurrence']}")
-        print(f"   📋 Pattern Years: {pred['pattern_years']}")
+        print(f"{i}. 🏢 {company}")
+        print(f"   📅 Predicted Ex-Date: {predicted_date} ({days_until} days)")
+        print(f"   💰 Avg Historical Dividend: {avg_dividend:.4f}")
+        print(f"   📊 Pattern Frequency: {frequency} times")
+        print(f"   🎯 Confidence: {confidence}%")
+        print(f"   📈 Last Occurrence: {last_occurrence}")
+        print(f"   📋 Pattern Years: {pattern_years}")
         print()
 
 def main():
@@ -336,7 +407,7 @@ def main():
     
     if args.list:
         print("Available CSV files:")
-        for f in sorted(glob.glob("*.csv")):
+        for f in sorted(entry.name for entry in list_csv_files()):
             print(f"  - {f}")
         return
     
@@ -348,7 +419,7 @@ def main():
     
     if not csv_file:
         print("Error: No CSV file found")
-        print("Available CSV files:", glob.glob("*.csv"))
+        print("Available CSV files:", [entry.name for entry in list_csv_files()])
         return
     
     if not os.path.exists(csv_file):
@@ -358,31 +429,19 @@ def main():
     try:
         print(f"Reading data from: {csv_file}")
         
-        # Read CSV with proper encoding for Hebrew
-        try:
-            df = pd.read_csv(csv_file, encoding=DEFAULT_OUTPUT_ENCODING)
-        except UnicodeDecodeError:
-            df = pd.read_csv(csv_file, encoding='utf-8')
-        
-        # Skip empty first row if present
-        if df.iloc[0].isna().all():
-            df = df.iloc[1:].reset_index(drop=True)        # Convert date columns
-        df['יום אקס דיבידנד'] = pd.to_datetime(df['יום אקס דיבידנד'], format=DATE_FORMAT, errors='coerce')
-        df['תאריך תשלום'] = pd.to_datetime(df['תאריך תשלום'], format=DATE_FORMAT, errors='coerce')
-          # Normalize company names (replace non-breaking spaces with regular spaces)
-        df['חברה'] = df['חברה'].str.replace('\xa0', ' ', regex=False)
+        df = load_dividend_data(csv_file, os.path.getmtime(csv_file))
         
         # Analyze patterns with custom min_frequency
-        company_patterns = analyze_dividend_patterns(df, min_frequency)
+        patterns = analyze_dividend_patterns(df, min_frequency)
         
-        if not company_patterns:
+        if patterns.empty:
             print("No reliable dividend patterns found for prediction.")
             return
             
-        print(f"Found patterns for {len(company_patterns)} companies")
+        print(f"Found patterns for {patterns['חברה'].nunique()} companies")
         
         # Generate predictions
-        predictions = predict_upcoming_announcements(company_patterns, args.days)
+        predictions = predict_upcoming_announcements(patterns, args.days)
         
         # Print results to console
         print_predictions(predictions, args.days)
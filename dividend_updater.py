@@ -1,14 +1,18 @@
 import pandas as pd
 import re
-import glob
 import os
 import argparse
 import pandas as pd
 import re
-import glob
 import os
 import argparse
-from datetime import datetime
+import fnmatch
+import functools
+import logging
+import unicodedata
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 # =============================================================================
 # HELP DOCUMENTATION
@@ -29,6 +33,7 @@ OPTIONS:
     --md FILE       Specify input markdown file path
     --csv FILE      Specify output CSV file path  
     --list          List all available MD and CSV files in current directory
+    --verbose       Also report every successfully parsed entry
     --info          Show detailed help information
 
 AUTOMATIC FILE DETECTION:
@@ -69,197 +74,223 @@ OUTPUT:
 """
 
 # =============================================================================
+# COMPANY NAME PATTERNS
+# =============================================================================
+
+MARKDOWN_COMPANY_RE = re.compile(r'^\*\*([^*]+)\*\*\s*\(\[([^\]]+)\]')  # **Company Name** ([ACRONYM](link))
+COMPANY_ACRONYM_RE = re.compile(r'^([^(]+)\s*\(([^)]+)\)')  # Company Name (ACRONYM)
+COMPANY_NAME_RE = re.compile(r'^([^(]+)')  # Company name up to the acronym
+PARENTHESES_RE = re.compile(r'\([^\)]+\)')
+
+# Deletes every character str.isspace() accepts (the same set as regex \s; none above U+3000)
+WHITESPACE_TABLE = str.maketrans('', '', ''.join(c for c in map(chr, range(0x3001)) if c.isspace()))
+
+# =============================================================================
+
+def scan_cwd():
+    """Split the MD and CSV files in the current directory with a single directory scan."""
+    md_files, csv_files = [], []
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_file():
+                continue
+            if entry.name.endswith('.md'):
+                md_files.append(entry)
+            elif entry.name.endswith('.csv'):
+                csv_files.append(entry)
+    return md_files, csv_files
 
-def find_latest_file(pattern, search_word=None):
+def find_latest_file(files, pattern, search_word=None):
     """Find the most recently modified file matching the pattern and optionally containing a word."""
-    files = glob.glob(pattern)
-    if search_word:
-        files = [f for f in files if search_word.lower() in f.lower()]
-    
-    if not files:
-        return None
+    needle = search_word.lower() if search_word else None
+    latest_file = None
+    latest_mtime = -1
+    # DirEntry.stat() is cached, so entries shared between lookups are stat'ed once
+    for entry in files:
+        if not fnmatch.fnmatch(entry.name, pattern):
+            continue
+        if needle and needle not in entry.name.lower():
+            continue
+        mtime = entry.stat().st_mtime
+        if mtime > latest_mtime:
+            latest_mtime, latest_file = mtime, entry.name
     
-    return max(files, key=os.path.getmtime)
+    return latest_file
 
+@functools.lru_cache(maxsize=4096)
 def normalize_company_name(name):
-    """Normalize company name by removing spaces and common variations."""
+    """Normalize company name by removing spaces and common variations.
+    
+    Cached, since the same names recur across the CSV history and MD updates.
+    """
     if not isinstance(name, str):
         return str(name)
+    # Fold composed/decomposed and compatibility forms so equal-looking names match
+    name = unicodedata.normalize('NFKC', name)
     # Remove all whitespace and convert to string
-    name = re.sub(r'\s+', '', name)
+    name = name.translate(WHITESPACE_TABLE)
     # Remove parentheses and their contents (like acronyms)
-    name = re.sub(r'\([^\)]+\)', '', name)
+    if '(' in name:
+        before, _, rest = name.partition('(')
+        inside, closed, after = rest.partition(')')
+        if inside and closed and '(' not in after:
+            name = before + after
+        else:
+            # Several or empty parentheses
+            name = PARENTHESES_RE.sub('', name)
     return name.strip()
 
 def parse_md_file(md_file_path):
     """Parse the markdown file and extract dividend information."""
+    print(f"\nProcessing file: {md_file_path}")
+    
+    # Stream the file, keeping table rows only and skipping header lines,
+    # separators and date headers
     with open(md_file_path, 'r', encoding='utf-8') as file:
-        content = file.read()
+        lines = [
+            line for line in (raw_line.strip() for raw_line in file)
+            if line.startswith('|') and '--' not in line and 'חברה' not in line
+            and not ('יום' in line and ('במאי' in line or 'ביוני' in line or 'באפריל' in line))
+        ]
+    if not lines:
+        print("Found 0 valid entries in file")
+        return pd.DataFrame(), 0
+    rows = pd.Series(lines, dtype=object)
     
-    print(f"\nProcessing file: {md_file_path}")
+    # Split by pipes; column 0 is the empty cell before the leading pipe, so
+    # columns 1-7 are: empty, company, ex_date, dividend, type, payment_date, yield.
+    # Only the columns used below are kept and stripped
+    fields = rows.str.split('|', expand=True).reindex(columns=[2, 3, 4, 6, 7], fill_value='')
+    fields = fields.apply(lambda column: column.str.strip()).fillna('')
+    # A trailing pipe leaves an empty last element that does not count as a column
+    part_count = rows.str.count(r'\|') - rows.str.endswith('|').astype(int)
     
-    entries = []
-    content_lines = content.split('\n')
-    seen_entries = set()  # Track unique entries by company, date, and amount
+    company_full = fields[2]
+    ex_date = fields[3]
+    dividend_str = fields[4]
+    payment_date = fields[6]
     
-    for line in content_lines:
-        line = line.strip()
-        
-        # Skip empty lines, header lines, and date headers
-        if not line or 'חברה' in line or ('יום' in line and ('במאי' in line or 'ביוני' in line or 'באפריל' in line)):
-            continue
-              # Skip lines with dashes or other separators  
-        if '--' in line or not line.startswith('|'):
-            continue
-        
-        # Split by pipes and clean up
-        parts = [part.strip() for part in line.split('|')]
-        # Remove empty first and last elements (common in markdown tables)
-        if len(parts) > 0 and parts[0] == '':
-            parts = parts[1:]
-        if len(parts) > 0 and parts[-1] == '':
-            parts = parts[:-1]
-        
-        # We need at least 6 parts: empty, company, ex_date, dividend, type, payment_date, yield
-        if len(parts) < 6:
-            continue
-              # Skip rows where the company column is empty (date header rows)
-        if not parts[1].strip():
-            continue
-            
-        try:            # Extract company name and clean up markdown formatting
-            company_full = parts[1].strip()  # Company is in column 1
-            
-            # Remove markdown bold syntax and extract clean company name and acronym
-            # Pattern: **Company Name** ([ACRONYM](link))
-            markdown_match = re.match(r'\*\*([^*]+)\*\*\s*\(\[([^\]]+)\]', company_full)
-            if markdown_match:
-                company_name = markdown_match.group(1).strip()
-                acronym = markdown_match.group(2).strip()
-                company_with_acronym = f"{company_name} ({acronym})"
-            else:
-                # Fallback: try to extract from regular format
-                if '(' in company_full and ')' in company_full:
-                    regular_match = re.match(r'^([^(]+)\s*\(([^)]+)\)', company_full)
-                    if regular_match:
-                        company_name = regular_match.group(1).strip()
-                        acronym = regular_match.group(2).strip()
-                        company_with_acronym = f"{company_name} ({acronym})"
-                    else:
-                        company_with_acronym = company_full
-                else:
-                    company_with_acronym = company_full
-            
-            ex_date = parts[2].strip()       # Ex-date is in column 2
-            dividend_str = parts[3].strip()  # Dividend is in column 3
-            payment_date = parts[5].strip()  # Payment date is in column 5
-            yield_str = parts[6].strip() if len(parts) > 6 else ''  # Yield is in column 6
-            
-            # Skip entries with empty dividend or invalid dates
-            if not dividend_str or not ex_date or not payment_date:
-                continue
-                
-            # Convert dividend to float
-            try:
-                dividend = float(dividend_str)
-            except ValueError:
-                continue
-                
-            # Basic validation
-            if dividend <= 0:
-                print(f"Warning: Skipping {company_with_acronym} - invalid dividend amount: {dividend}")
-                continue
-                
-            # Validate date format and payment after ex-date
-            try:
-                ex_date_dt = datetime.strptime(ex_date, '%d.%m.%Y')
-                payment_date_dt = datetime.strptime(payment_date, '%d.%m.%Y')
-                if payment_date_dt < ex_date_dt:
-                    print(f"Warning: Skipping {company_with_acronym} - payment date {payment_date} is before ex-date {ex_date}")
-                    continue
-            except ValueError as e:
-                print(f"Warning: Skipping {company_with_acronym} - invalid date format: {e}")
-                continue
-            
-            # Check for duplicates within MD file
-            entry_key = f"{company_with_acronym}_{ex_date}_{dividend}"
-            if entry_key in seen_entries:
-                print(f"Skipping duplicate in MD file: {company_with_acronym} on {ex_date}")
-                continue
-            seen_entries.add(entry_key)
-            
-            entries.append({
-                'חברה': company_with_acronym,
-                'יום אקס דיבידנד': ex_date,
-                'דיבידנד': dividend,
-                'סוג': '',  # Empty string for 'סוג' column
-                'תאריך תשלום': payment_date,
-                'תשואה': yield_str,  # Keep the yield as string
-                'Comfortable Date X': ex_date_dt.strftime('%Y-%m-%d')
-            })
-            print(f"Successfully parsed entry: {company_with_acronym}")
-            
-        except Exception as e:
-            print(f"Error processing line '{line}': {e}")
-            continue
+    # Need at least 6 columns, a company (date header rows have none) and
+    # non-empty dividend and dates
+    has_fields = ((part_count >= 6) & (company_full != '') & (ex_date != '')
+                  & (dividend_str != '') & (payment_date != ''))
+    dividend = pd.to_numeric(dividend_str.where(has_fields), errors='coerce').astype(float)
+    candidate = has_fields & dividend.notna()
+    
+    # Extract clean company name and acronym
+    # Pattern: **Company Name** ([ACRONYM](link)), falling back to Company Name (ACRONYM)
+    markdown_parts = company_full.str.extract(MARKDOWN_COMPANY_RE)
+    regular_parts = company_full.str.extract(COMPANY_ACRONYM_RE)
+    company = (
+        (markdown_parts[0].str.strip() + ' (' + markdown_parts[1].str.strip() + ')')
+        .fillna(regular_parts[0].str.strip() + ' (' + regular_parts[1].str.strip() + ')')
+        .fillna(company_full)
+    )
+    
+    # Validate amount, date format and payment after ex-date
+    ex_date_dt = pd.to_datetime(ex_date.where(candidate), format='%d.%m.%Y', errors='coerce', cache=True)
+    payment_date_dt = pd.to_datetime(payment_date.where(candidate), format='%d.%m.%Y', errors='coerce', cache=True)
+    invalid_dividend = candidate & (dividend <= 0)
+    invalid_date = candidate & ~invalid_dividend & (ex_date_dt.isna() | payment_date_dt.isna())
+    payment_before_ex = candidate & ~invalid_dividend & ~invalid_date & (payment_date_dt < ex_date_dt)
+    valid = candidate & ~invalid_dividend & ~invalid_date & ~payment_before_ex
+    
+    entries = pd.DataFrame({
+        'חברה': company,
+        'יום אקס דיבידנד': ex_date_dt,
+        'דיבידנד': dividend,
+        'סוג': '',  # Empty string for 'סוג' column
+        'תאריך תשלום': payment_date,
+        'תשואה': fields[7],  # Keep the yield as string
+        'Comfortable Date X': ex_date_dt.dt.strftime('%Y-%m-%d')
+    })
+    
+    # Check for duplicates within MD file
+    md_duplicate = (entries[valid].duplicated(subset=['חברה', 'יום אקס דיבידנד', 'דיבידנד'])
+                    .reindex(entries.index, fill_value=False))
+    parsed = valid & ~md_duplicate
+    
+    # Report each row in file order
+    messages = pd.Series(None, index=rows.index, dtype=object)
+    messages[invalid_dividend] = ("Warning: Skipping " + company + " - invalid dividend amount: "
+                                  + dividend.astype(str))
+    messages[invalid_date] = ("Warning: Skipping " + company + " - invalid date format: "
+                              + ex_date + ", " + payment_date)
+    messages[payment_before_ex] = ("Warning: Skipping " + company + " - payment date " + payment_date
+                                   + " is before ex-date " + ex_date)
+    messages[md_duplicate] = "Skipping duplicate in MD file: " + company + " on " + ex_date
+    messages = messages.dropna()
+    if not messages.empty:
+        print('\n'.join(messages))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('\n'.join("Successfully parsed entry: " + company[parsed]))
     
+    entries = entries[parsed].reset_index(drop=True)
     print(f"Found {len(entries)} valid entries in file")
-    return pd.DataFrame(entries), len(entries)
+    return entries, len(entries)
 
-def is_duplicate_entry(row, df_csv):
-    """Check if an entry is a duplicate using normalized company names."""
-    try:
-        company = row['חברה']
-        ex_date = row['יום אקס דיבידנד']
-        dividend = row['דיבידנד']
-        
-        # Extract company name without acronym
-        company_match = re.match(r'^([^(]+)', company)
-        if company_match:
-            company = company_match.group(1).strip()
-        
-        # Normalize company names for comparison
-        normalized_new = normalize_company_name(company)
-        
-        # Create temporary column with normalized names
-        df_csv['normalized_name'] = df_csv['חברה'].apply(normalize_company_name)
-        
-        try:
-            # Check for exact matches
-            exact_matches = df_csv[
-                (df_csv['normalized_name'] == normalized_new) &
-                (df_csv['יום אקס דיבידנד'] == ex_date) &
-                (abs(df_csv['דיבידנד'] - dividend) < 0.01)
-            ]
-            
-            if not exact_matches.empty:
-                return True, "exact match"
-                
-            # Check date matches
-            date_matches = df_csv[df_csv['יום אקס דיבידנד'] == ex_date]
-            for _, existing in date_matches.iterrows():
-                if (abs(existing['דיבידנד'] - dividend) < 0.01 and 
-                    normalize_company_name(existing['חברה']) == normalized_new):
-                    return True, f"same amount and date (normalized name: {existing['חברה']})"
-            
-            return False, None
-            
-        finally:
-            # Always clean up temporary column
-            if 'normalized_name' in df_csv.columns:
-                df_csv.drop('normalized_name', axis=1, inplace=True, errors='ignore')
-                
-    except Exception as e:
-        print(f"Warning: Error in duplicate detection: {e}")
-        return False, None
+def dividend_cents(amounts):
+    """Round dividend amounts to whole cents so they can be compared exactly."""
+    return (pd.to_numeric(amounts, errors='coerce') * 100).round().astype('Int64')
+
+def find_duplicate_entries(df_new, df_csv):
+    """Flag new entries already in the CSV, matching on normalized company names.
+    
+    Returns a boolean array aligned with the rows of df_new.
+    """
+    # Extract company name without acronym
+    new_names = df_new['חברה'].str.extract(COMPANY_NAME_RE, expand=False).fillna(df_new['חברה'])
+    
+    # Normalize (once per distinct name when the CSV column is categorical) and
+    # encode both sides with shared categories so the join compares integer codes
+    normalized_names = pd.Categorical(pd.concat([
+        new_names.map(normalize_company_name),
+        df_csv['חברה'].map(normalize_company_name).astype(object)
+    ], ignore_index=True))
+    
+    new_keys = pd.DataFrame({
+        'row': range(len(df_new)),
+        'normalized_name': normalized_names[:len(df_new)],
+        'יום אקס דיבידנד': df_new['יום אקס דיבידנד'].to_numpy(),
+        'dividend_cents': dividend_cents(df_new['דיבידנד']).array
+    })
+    csv_keys = pd.DataFrame({
+        'normalized_name': normalized_names[len(df_new):],
+        'יום אקס דיבידנד': df_csv['יום אקס דיבידנד'].to_numpy(),
+        'dividend_cents': dividend_cents(df_csv['דיבידנד']).array
+    })
+    
+    # Join on name, date and amount in cents once
+    matches = new_keys.merge(csv_keys, on=['normalized_name', 'יום אקס דיבידנד', 'dividend_cents'])
+    
+    return new_keys['row'].isin(matches['row']).to_numpy()
 
 def update_csv_file(csv_file_path, md_file_path):
     """Update the CSV file with new dividend information from the MD file."""
     # Define the column names
     columns = ['חברה', 'יום אקס דיבידנד', 'דיבידנד', 'סוג', 'תאריך תשלום', 'תשואה', 'Comfortable Date X']
-      # Read existing CSV file and handle empty first row
+    # Read existing CSV file and handle empty first row
+    # Every other column is read as text so the reader never infers dates in
+    # them; the pyarrow engine would otherwise apply date parsing to any column
+    # that looks like dates and change how it is written back
+    read_options = {
+        'dtype': {
+            'חברה': 'category',
+            'יום אקס דיבידנד': 'string',
+            'דיבידנד': 'float64',
+            'סוג': 'string',
+            'תאריך תשלום': 'string',
+            'תשואה': 'string',
+            'Comfortable Date X': 'string'
+        }
+    }
+    try:
+        import pyarrow  # noqa: F401
+        read_options['engine'] = 'pyarrow'
+    except ImportError:
+        pass
     try:
-        df_csv = pd.read_csv(csv_file_path, encoding='utf-8-sig')
+        df_csv = pd.read_csv(csv_file_path, encoding='utf-8-sig', **read_options)
         print(f"CSV columns found: {list(df_csv.columns)}")
         # If the first row is empty, skip it
         if df_csv.iloc[0].isna().all():
@@ -274,29 +305,19 @@ def update_csv_file(csv_file_path, md_file_path):
         print("No valid entries found in the MD file.")
         return
     
-    # Convert date columns to consistent format for comparison
-    df_csv['יום אקס דיבידנד'] = pd.to_datetime(df_csv['יום אקס דיבידנד'], format='%d.%m.%Y', errors='coerce').dt.strftime('%d.%m.%Y')
-    df_new['יום אקס דיבידנד'] = pd.to_datetime(df_new['יום אקס דיבידנד'], format='%d.%m.%Y').dt.strftime('%d.%m.%Y')
+    # Ex-dates are parsed once and stay datetime64 until the file is written
+    df_csv['יום אקס דיבידנד'] = pd.to_datetime(df_csv['יום אקס דיבידנד'], format='%d.%m.%Y', errors='coerce', cache=True)
     
     # Check for duplicates in CSV file
-    duplicates = []
-    new_entries_list = []
+    is_duplicate = find_duplicate_entries(df_new, df_csv)
+    duplicates = df_new[is_duplicate]
+    new_entries = df_new[~is_duplicate]
     
-    for _, new_row in df_new.iterrows():
-        is_dup, reason = is_duplicate_entry(new_row, df_csv)
-        if is_dup:
-            duplicates.append((new_row, reason))
-        else:
-            new_entries_list.append(new_row)
-    
-    # Report duplicates with reasons
-    if duplicates:
+    # Report duplicates
+    if not duplicates.empty:
         print("\nSkipping entries already in CSV:")
-        for row, reason in duplicates:
-            print(f"- {row['חברה']} on {row['יום אקס דיבידנד']} ({row['דיבידנד']}): {reason}")
-    
-    # Convert new entries back to DataFrame
-    new_entries = pd.DataFrame(new_entries_list) if new_entries_list else pd.DataFrame()
+        print('\n'.join(f"- {company} on {ex_date:%d.%m.%Y} ({dividend}): exact match"
+                        for company, ex_date, dividend in zip(duplicates['חברה'], duplicates['יום אקס דיבידנד'], duplicates['דיבידנד'])))
     
     # Print final summary regardless of new entries
     print("\nProcessing Summary:")
@@ -314,30 +335,38 @@ def update_csv_file(csv_file_path, md_file_path):
     if len(new_entries) == 0:
         return
     
-    # Sort by ex-dividend date
-    df_updated = pd.concat([df_csv, new_entries], ignore_index=True)
-    df_updated['sort_date'] = pd.to_datetime(df_updated['יום אקס דיבידנד'], format='%d.%m.%Y')
-    df_updated = df_updated.sort_values('sort_date')
-    df_updated = df_updated.drop('sort_date', axis=1)
+    # Sort by ex-dividend date. The CSV is normally sorted already, so the few
+    # new rows are inserted after existing rows with the same date instead of
+    # sorting the whole frame
+    sorted_new_entries = new_entries.sort_values('יום אקס דיבידנד', kind='stable')
+    df_updated = pd.concat([df_csv, sorted_new_entries], ignore_index=True)
+    csv_dates = df_csv['יום אקס דיבידנד']
+    if csv_dates.is_monotonic_increasing and not csv_dates.hasnans:
+        positions = csv_dates.searchsorted(sorted_new_entries['יום אקס דיבידנד'], side='right')
+        order = np.insert(np.arange(len(df_csv)), positions, np.arange(len(df_csv), len(df_updated)))
+        df_updated = df_updated.take(order)
+    else:
+        df_updated = df_updated.sort_values('יום אקס דיבידנד', kind='stable')
     
-    # Add empty row at the beginning to maintain file structure
-    empty_row = pd.DataFrame([['' for _ in range(len(df_updated.columns))]], columns=df_updated.columns)
-    df_updated = pd.concat([empty_row, df_updated], ignore_index=True)
-    
-    # Save updated DataFrame to CSV
-    df_updated.to_csv(csv_file_path, index=False, encoding='utf-8-sig')
+    # Save updated DataFrame to CSV, writing the empty row after the header
+    # directly to maintain file structure
+    with open(csv_file_path, 'w', encoding='utf-8-sig', newline='') as file:
+        df_updated.head(0).to_csv(file, index=False)
+        file.write(',' * (len(df_updated.columns) - 1) + os.linesep)
+        # Ex-dates are only formatted back to DD.MM.YYYY as they are written
+        df_updated.to_csv(file, index=False, header=False, date_format='%d.%m.%Y')
     print("\nNew entries added to CSV:")
-    for _, row in new_entries.iterrows():
-        print(f"- {row['חברה']}: {row['יום אקס דיבידנד']}, {row['דיבידנד']}")
+    print('\n'.join(f"- {company}: {ex_date:%d.%m.%Y}, {dividend}"
+                    for company, ex_date, dividend in zip(new_entries['חברה'], new_entries['יום אקס דיבידנד'], new_entries['דיבידנד'])))
 
-def list_available_files():
+def list_available_files(md_files, csv_files):
     """List all available MD and CSV files in the current directory."""
     print("\nAvailable files:")
     print("MD files:")
-    for f in sorted(glob.glob("*.md")):
+    for f in sorted(entry.name for entry in md_files):
         print(f"  - {f}")
     print("\nCSV files:")
-    for f in sorted(glob.glob("*.csv")):
+    for f in sorted(entry.name for entry in csv_files):
         print(f"  - {f}")
     print()
 
@@ -351,32 +380,39 @@ def main():
     parser.add_argument('--csv', help='Output CSV file path')
     parser.add_argument('--list', action='store_true', help='List available files')
     parser.add_argument('--info', action='store_true', help='Show detailed help information')
+    parser.add_argument('--verbose', action='store_true', help='Report every successfully parsed entry')
     args = parser.parse_args()
     
+    if args.verbose:
+        logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+    
     if args.info:
         show_help()
         return
     
+    # Scan the directory once for listing and automatic file detection
+    md_files, csv_files = scan_cwd()
+    
     if args.list:
-        list_available_files()
+        list_available_files(md_files, csv_files)
         return
       # Find the most recent files if not specified
-    csv_file = args.csv or find_latest_file("*Historical_Dividend*.csv", None) or find_latest_file("*.csv", "Historical")
-    md_file = args.md or find_latest_file("*Update*.md", None)  # Look for Update in the filename directly
+    csv_file = args.csv or find_latest_file(csv_files, "*Historical_Dividend*.csv", None) or find_latest_file(csv_files, "*.csv", "Historical")
+    md_file = args.md or find_latest_file(md_files, "*Update*.md", None)  # Look for Update in the filename directly
     
     # If no update file found, try looking for any .md file with "update" in it
     if not md_file:
-        md_file = find_latest_file("*.md", "update")
+        md_file = find_latest_file(md_files, "*.md", "update")
         
-    list_available_files()  # Always show available files
+    list_available_files(md_files, csv_files)  # Always show available files
     
     if not csv_file:
         print("Error: No CSV file found with 'Dividends' or 'Historical_Dividend' in the name")
-        print("Available CSV files:", glob.glob("*.csv"))
+        print("Available CSV files:", [entry.name for entry in csv_files])
         return
     if not md_file:
         print("Error: No markdown file found with 'Update' in the name")
-        print("Available MD files:", glob.glob("*.md"))
+        print("Available MD files:", [entry.name for entry in md_files])
         return
     
     print(f"Using CSV file: {csv_file}")
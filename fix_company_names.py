@@ -1,6 +1,9 @@
 import pandas as pd
 import re
 
+# Pattern: **Company Name** ([ACRONYM](link)) or variations
+MARKDOWN_COMPANY_RE = re.compile(r'^\*\*([^*]+)\*\*\s*\(\[([^\]]+)\]')
+
 def fix_company_names_in_csv(csv_file_path):
     """Fix company names that have markdown formatting in the CSV file."""
     
@@ -17,27 +20,21 @@ def fix_company_names_in_csv(csv_file_path):
     
     print(f"Total rows to process: {len(df)}")
     
-    # Track changes
-    changes_made = 0
+    # Find company names with markdown formatting; only names starting with
+    # '**' can match, so the regex runs on those alone
+    company_names = df['חברה'].astype(str)
+    starts_bold = company_names.str.startswith('**')
+    markdown_parts = company_names[starts_bold].str.extract(MARKDOWN_COMPANY_RE).reindex(company_names.index)
+    has_markdown = markdown_parts[0].notna()
     
-    # Process each company name
-    for idx, row in df.iterrows():
-        company_name = str(row['חברה'])
-        
-        # Check if this has markdown formatting
-        # Pattern: **Company Name** ([ACRONYM](link)) or variations
-        markdown_pattern = r'\*\*([^*]+)\*\*\s*\(\[([^\]]+)\]'
-        match = re.match(markdown_pattern, company_name)
-        
-        if match:
-            # Extract clean company name and acronym
-            clean_company = match.group(1).strip()
-            acronym = match.group(2).strip()
-            new_name = f"{clean_company} ({acronym})"
-            
-            print(f"Fixing: '{company_name}' -> '{new_name}'")
-            df.at[idx, 'חברה'] = new_name
-            changes_made += 1
+    # Extract clean company name and acronym
+    new_names = markdown_parts[0].str.strip() + ' (' + markdown_parts[1].str.strip() + ')'
+    
+    if has_markdown.any():
+        print('\n'.join(f"Fixing: '{company_name}' -> '{new_name}'"
+                        for company_name, new_name in zip(company_names[has_markdown], new_names[has_markdown])))
+    df.loc[has_markdown, 'חברה'] = new_names[has_markdown]
+    changes_made = int(has_markdown.sum())
     
     print(f"\nTotal changes made: {changes_made}")
     